@@ -361,6 +361,21 @@ class BeakerCacheController(TGController):  # For backward compatibility
         BeakerCacheController.CALL_COUNT += 1
         return 'Counter=%s' % BeakerCacheController.CALL_COUNT
 
+    def annotated_args(self, arg):
+        BeakerCacheController.CALL_COUNT += 1
+        return 'Counter=%s' % BeakerCacheController.CALL_COUNT
+    # Annotations make getargspec fail on Python3, set them without py3 only syntax
+    annotated_args.__annotations__ = {'arg': str}
+    annotated_args = expose()(beaker_cache()(annotated_args))
+
+
+class _UninspectableCallable(object):
+    """Callable for which inspect is unable to retrieve arguments"""
+    __signature__ = 'unsupported'
+
+    def __call__(self):
+        return 'Uninspectable'
+
 
 class TestCacheTouch(TestWSGIController):
     CACHED_CONTROLLER = CachedController
@@ -568,3 +583,19 @@ class TestBeakerCacheTouch(TestWSGIController):
         assert 'Counter=1' in r
         r = self.app.get('/disabled_cache')
         assert 'Counter=2' in r
+
+    def test_annotated_args(self):
+        self.CACHED_CONTROLLER.CALL_COUNT = 0
+
+        r = self.app.get('/annotated_args?arg=x')
+        assert 'Counter=1' in r, r
+        r = self.app.get('/annotated_args?arg=x')
+        assert 'Counter=1' in r, r
+        r = self.app.get('/annotated_args?arg=y')
+        assert 'Counter=2' in r, r
+
+    def test_none_key_uninspectable_callable(self):
+        callable_ = _UninspectableCallable()
+        callable_.__name__ = 'uninspectable'
+        cached = beaker_cache(key=None)(callable_)
+        assert cached.__name__ == 'uninspectable'
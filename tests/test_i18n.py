@@ -2,6 +2,7 @@
 from nose.tools import raises
 from webtest import TestApp
 import gettext as _gettext
+import os, shutil, struct, tempfile, warnings
 
 import tg
 from tg import i18n, expose, TGController, config
@@ -32,6 +33,9 @@ class TestSanitizeLanguage():
     def test_sanitize_language_code_charset(self):
         assert i18n.sanitize_language_code('en_US.UTF-8') == 'en_US'
 
+    def test_sanitize_language_code_dash_charset(self):
+        assert i18n.sanitize_language_code('en-US.UTF-8') == 'en_US'
+
     def test_sanitize_language_code_modifier(self):
         assert i18n.sanitize_language_code('it_IT@euro') == 'it_IT'
 
@@ -47,6 +51,33 @@ class TestSanitizeLanguage():
     def test_sanitize_language_code_numeric_variant(self):
         assert i18n.sanitize_language_code('de-CH-1996') == 'de_CH'
 
+    def test_sanitize_language_code_cached(self):
+        lang = i18n.sanitize_language_code('fr-ca')
+        assert i18n._sanitized_language_cache.get('fr-ca') == 'fr_CA'
+        assert i18n.sanitize_language_code('fr-ca') is lang
+
+    def test_sanitized_language_cache_deprecated_dict_access(self):
+        i18n.sanitize_language_code('es-mx')
+        cache = i18n.sanitized_language_cache
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            assert 'es-mx' in cache
+            assert cache['es-mx'] == 'es_MX'
+            assert cache.get('missing') is None
+            cache['custom'] = 'en_US'
+            assert i18n.sanitize_language_code('custom') == 'en_US'
+            assert cache.pop('custom') == 'en_US'
+            assert cache.pop('custom', None) is None
+            assert 'custom' not in cache
+        assert all(issubclass(x.category, DeprecationWarning) for x in w), w
+        assert len(w) == 7, w
+
+    @raises(KeyError)
+    def test_sanitized_language_cache_deprecated_missing_key(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            i18n.sanitized_language_cache['missing-lang']
+
 def test_formencode_gettext_nulltranslation():
     prev_gettext = i18n.ugettext
     def nop_gettext(v):
@@ -70,6 +101,40 @@ def test_get_unaccessible_translator():
     finally:
         _gettext.find = real_find
 
+def test_mofile_lookup_cached():
+    mofile = os.path.join('tests', 'i18n', 'de', 'LC_MESSAGES', 'tests.mo')
+    calls = []
+    def _fake_find(*args, **kwargs):
+        calls.append(args)
+        return mofile
+
+    real_find = _gettext.find
+    _gettext.find = _fake_find
+    try:
+        for i in range(2):
+            i18n._get_translator(['de'], tg_config={'localedir': 'cached_lookup',
+                                                    'package': _FakePackage()})
+    finally:
+        _gettext.find = real_find
+    assert len(calls) == 1, calls
+
+def test_mofile_lookup_missing_not_cached():
+    calls = []
+    def _fake_find(*args, **kwargs):
+        calls.append(args)
+        return None
+
+    real_find = _gettext.find
+    _gettext.find = _fake_find
+    try:
+        for i in range(2):
+            i18n._get_translator(['xx'], tg_config={'localedir': 'missing_lookup',
+                                                    'package': _FakePackage()},
+                                 fallback=True)
+    finally:
+        _gettext.find = real_find
+    assert len(calls) == 2, calls
+
 class i18nRootController(TGController):
     def _before(self, *args, **kw):
         if not tg.request.GET.get('skip_lang'):
@@ -131,6 +196,10 @@ class TestI18NStack(object):
     def teardown(self):
         config.pop('tg.root_controller')
 
+    def test_translations_preloaded(self):
+        mofile = os.path.abspath(os.path.join('tests', 'i18n', 'kr', 'LC_MESSAGES', 'tests.mo'))
+        assert (_gettext.GNUTranslations, mofile) in i18n._TRANSLATORS_CACHE
+
     def test_lazy_gettext(self):
         r = self.app.get('/lazy_hello')
         assert 'Ihre Anwendung' in r
@@ -200,6 +269,44 @@ class TestI18NStack(object):
         assert '[]' in r, r.body
 
 
+def _write_mofile(path, header):
+    """Writes a GNU mo file containing only the catalog header"""
+    msgid, msgstr = b'', header.encode('utf-8')
+    strings_offset = 7 * 4 + 2 * 2 * 4
+    with open(path, 'wb') as mo:
+        mo.write(struct.pack('<7I', 0x950412de, 0, 1, 7 * 4, 7 * 4 + 2 * 4, 0, 0))
+        mo.write(struct.pack('<2I', len(msgid), strings_offset))
+        mo.write(struct.pack('<2I', len(msgstr), strings_offset + len(msgid) + 1))
+        mo.write(msgid + b'\0' + msgstr + b'\0')
+
+
+class TestI18NStackBrokenCatalog(object):
+    def setup(self):
+        self.root = tempfile.mkdtemp()
+        modir = os.path.join(self.root, 'i18n', 'xx', 'LC_MESSAGES')
+        os.makedirs(modir)
+        _write_mofile(os.path.join(modir, 'tests.mo'),
+                      'Content-Type: text/plain; charset=UTF-8\n'
+                      'Plural-Forms: nplurals=2; plural=n+++;\n')
+
+    def teardown(self):
+        config.pop('tg.root_controller')
+        shutil.rmtree(self.root)
+
+    def test_app_builds_with_broken_catalog(self):
+        conf = AppConfig(minimal=True, root_controller=i18nRootController())
+        conf['paths']['root'] = self.root
+        conf['i18n.enabled'] = True
+        conf.renderers = ['json']
+        conf.default_renderer = 'json'
+        conf.package = _FakePackage()
+        app = TestApp(conf.make_wsgi_app())
+
+        r = app.get('/hello', headers={'Accept-Language': 'en'},
+                    params={'skip_lang': 1})
+        assert 'Your application is now running' in r, r
+
+
 class TestI18NStackDefaultLang(object):
     def setup(self):
         conf = AppConfig(minimal=True, root_controller=i18nRootController())
@@ -191,3 +191,16 @@ class TestExposeLazyInheritance(object):
         assert deco.engines['text/html'][1] == 'new3_template.html', deco.engines
         assert deco.engines['text/plain'][1] == 'new_template.html', deco.engines
         assert deco.engines['text/javascript'][1] == 'new2_template.html', deco.engines
+
+    @raises(IndexError)
+    def test_exposition_errors_propagate(self):
+        class BrokenExposition(object):
+            def _apply(self):
+                raise IndexError('broken exposition')
+
+        def func():
+            pass
+
+        deco = Decoration.get_decoration(func)
+        deco._expositions.append(BrokenExposition())
+        deco._resolve_expositions()
@@ -912,6 +912,10 @@ class TestTGController(TestWSGIController):
         resp = self.app.get('/sub3/controller_url/false/a/b/c')
         assert resp.text == 'sub3/controller_url', resp.text
 
+    def test_controller_url_without_remainder(self):
+        resp = self.app.get('/sub3/controller_url')
+        assert resp.text == 'sub3/controller_url', resp.text
+
     def test_controller_url_backward_compatibility(self):
         resp = self.app.get('/sub3/controller_url/true/a/b/c')
         assert resp.text == 'sub3/controller_url', resp.text
@@ -154,6 +154,13 @@ class TestLazyString(object):
         lf = l.format('HI')
         assert lf == 'HI', lf
 
+    def test_lazy_string_reevaluated(self):
+        values = ['HI', 'HELLO']
+        l = LazyString(lambda: values[0])
+        assert str(l) == 'HI'
+        values.pop(0)
+        assert str(l) == 'HELLO'
+
     def test_lazy_string_with_genshi(self):
         # See https://github.com/TurboGears/tg2/pull/68
         from genshi.template.markup import MarkupTemplate
@@ -1,5 +1,5 @@
 import logging
-from ..i18n import sanitize_language_code, set_request_lang
+from ..i18n import sanitize_language_code, set_request_lang, _preload_translators
 from .._compat import string_type
 from ..support.converters import asbool
 from ..configuration.utils import coerce_config
@@ -44,6 +44,9 @@ class I18NApplicationWrapper(ApplicationWrapper):
         self.options = options
         log.debug('i18n enabled: %s -> %s', self.enabled, self.options)
 
+        if self.enabled or options['lang']:
+            _preload_translators(config)
+
     @property
     def injected(self):
         return self.enabled
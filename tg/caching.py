@@ -2,7 +2,7 @@
 import tg, inspect, time
 from tg.support.converters import asbool
 from tg.support import NoDefault, EmptyContext
-from tg._compat import im_func, im_class
+from tg._compat import im_func, im_class, PY3
 from functools import wraps
 
 
@@ -182,11 +182,15 @@ def beaker_cache(key="cache_default", expire="never", type=None,
     cache_headers = set(cache_headers)
 
     def beaker_cache_decorate(func):
+        # Arguments are only needed to build the key, avoid inspecting
+        # callables that inspect can't handle when no key is used.
+        func_args = _get_args_names(func) if key else None
+
         @wraps(func)
         def beaker_cached_call(*args, **kwargs):
             if key:
                 key_dict = kwargs.copy()
-                key_dict.update(_make_dict_from_args(func, args, kwargs))
+                key_dict.update(_make_dict_from_args(func_args, args, kwargs))
                 if query_args:
                     key_dict.update(tg.request.GET.mixed())
 
@@ -244,10 +248,18 @@ def create_cache_key(func, key_dict=None, self=None):
         return func.__module__, cache_key
 
 
-def _make_dict_from_args(func, args, kwargs):
-    """Inspects function for name of args"""
+def _get_args_names(func):
+    """Names of the positional arguments of func"""
+    if PY3:  # pragma: no cover
+        return inspect.getfullargspec(func)[0]
+    else:
+        return inspect.getargspec(func)[0]
+
+
+def _make_dict_from_args(func_args, args, kwargs):
+    """Maps args to the names of the function arguments"""
     args_keys = {}
-    for i, arg in enumerate(inspect.getargspec(func)[0]):
+    for i, arg in enumerate(func_args):
         if arg != "self":
             try:
                 args_keys[arg] = args[i]
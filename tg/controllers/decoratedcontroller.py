@@ -47,8 +47,10 @@ class DecoratedController(with_metaclass(_DecoratedControllerMeta, object)):
     """
     def _is_exposed(self, controller, name):
         method = getattr(controller, name, None)
-        if method and inspect.ismethod(method) and hasattr(method, 'decoration'):
-            return method.decoration.exposed
+        if method is not None and inspect.ismethod(method):
+            decoration = getattr(method, 'decoration', None)
+            if decoration is not None:
+                return decoration.exposed
 
     def _call(self, controller, params, remainder=None, context=None):
         """Run the controller with the given parameters.
@@ -79,7 +81,8 @@ class DecoratedController(with_metaclass(_DecoratedControllerMeta, object)):
 
         hooks = tg.hooks
         context_config = tg.config._current_obj()
-        context.request._fast_setattr('validation', _ValidationStatus())
+        req = context.request
+        req._fast_setattr('validation', _ValidationStatus())
 
         # This is necessary to prevent spurious Content Type header which would
         # cause problems to paste.response.replace_header calls and cause
@@ -97,7 +100,7 @@ class DecoratedController(with_metaclass(_DecoratedControllerMeta, object)):
                      controller=controller, context_config=context_config)
 
         validate_params = get_params_with_argspec(controller, params, remainder)
-        context.request.args_params = validate_params  # Update args_params with positional args
+        req.args_params = validate_params  # Update args_params with positional args
 
         try:
             params = self._perform_validate(controller, validate_params, context)
@@ -108,7 +111,7 @@ class DecoratedController(with_metaclass(_DecoratedControllerMeta, object)):
             bound_controller_callable = partial(controller, instance)
         else:
             bound_controller_callable = controller
-            context.request.validation.values = params
+            req.validation.values = params
             remainder, params = flatten_arguments(controller, params, remainder)
 
         hooks.notify('before_call', args=(remainder, params),
@@ -58,13 +58,13 @@ class CoreDispatcher(object):
                               path_translator=dispatch_path_translator)
 
         if enable_request_extensions:
-            try:
-                mimetypes = conf['mimetypes']
-            except KeyError:
-                mimetypes = default_mimetypes
-
             ext = state.extension
             if ext is not None:
+                try:
+                    mimetypes = conf['mimetypes']
+                except KeyError:
+                    mimetypes = default_mimetypes
+
                 ext = '.' + ext
                 mime_type, encoding = mimetypes.guess_type('file'+ext)
                 req._fast_setattr('_response_type', mime_type)
@@ -84,8 +84,9 @@ class CoreDispatcher(object):
         return state
 
     def _enter_controller(self, state, remainder):
-        if hasattr(state.controller, '_visit'):
-            state.controller._visit(*remainder, **state.params)
+        visit = getattr(state.controller, '_visit', None)
+        if visit is not None:
+            visit(*remainder, **state.params)
 
         return super(CoreDispatcher, self)._enter_controller(state, remainder)
 
@@ -100,15 +101,17 @@ class CoreDispatcher(object):
         controller, action = state.controller, state.action
         params, remainder = state.params, state.remainder
 
-        if hasattr(controller, '_before'):
-            controller._before(*remainder, **params)
+        before = getattr(controller, '_before', None)
+        if before is not None:
+            before(*remainder, **params)
 
         self._setup_wsgi_script_name(state.path, remainder, params)
 
         r = self._call(action, params, remainder=remainder, context=context)
 
-        if hasattr(controller, '_after'):
-            controller._after(*remainder, **params)
+        after = getattr(controller, '_after', None)
+        if after is not None:
+            after(*remainder, **params)
 
         return r
 
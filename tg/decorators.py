@@ -94,12 +94,10 @@ class Decoration(object):
 
     def _resolve_expositions(self):
         """Applies all the registered expositions"""
-        while True:
-            try:
-                exposition = self._expositions.pop(0)
-                exposition._apply()
-            except IndexError:
-                break
+        expositions = self._expositions
+        while expositions:
+            exposition = expositions.pop(0)
+            exposition._apply()
 
     @property
     def requirement(self):  # pragma: no cover
@@ -248,9 +246,11 @@ class Decoration(object):
         request = tgl.request
         response = tgl.response
 
-        try:
-            render_custom_format = request._render_custom_format[self.controller]
-        except:
+        render_custom_format = None
+        custom_formats = request._render_custom_format
+        if custom_formats is not None:
+            render_custom_format = custom_formats.get(self.controller)
+        if render_custom_format is None:
             render_custom_format = self.render_custom_format
 
         if render_custom_format:
@@ -260,12 +260,13 @@ class Decoration(object):
             if self.default_engine:
                 content_type = self.default_engine
             elif self.engines:
+                response_type = request._response_type
                 if response.content_type is not None:
                     # Check for overridden content type from the controller call
                     accept_types = response.content_type
-                elif request._response_type and request._response_type in self.engines:
+                elif response_type and response_type in self.engines:
                     # Check for content type detected by request extensions
-                    accept_types = request._response_type
+                    accept_types = response_type
                 else:
                     accept_types = request.headers.get('accept', '*/*')
                 content_type = Accept(accept_types).best_match(self.engines_keys, self.engines_keys[0])
@@ -276,7 +277,7 @@ class Decoration(object):
             try:
                 cnt_override_mapping = request._override_mapping[self.controller]
                 engine, template, exclude_names, render_params = cnt_override_mapping[content_type.split(";")[0]]
-            except (AttributeError, KeyError):
+            except (TypeError, KeyError):
                 (engine, template, exclude_names, render_params
                     ) = self.engines.get(content_type, (None,) * 4)
 
@@ -534,10 +535,10 @@ def use_custom_format(controller, custom_format):
     if custom_format not in deco.custom_engines:
         raise ValueError("'%s' is not a valid custom_format" % custom_format)
 
-    try:
-        render_custom_format = request._render_custom_format
-    except AttributeError:
-        render_custom_format = request._render_custom_format = {}
+    render_custom_format = request._render_custom_format
+    if render_custom_format is None:
+        render_custom_format = {}
+        request._fast_setattr('_render_custom_format', render_custom_format)
     render_custom_format[default_im_func(controller)] = custom_format
 
 
@@ -569,10 +570,10 @@ def override_template(view, template):
     for content_type, content_engine in engines.items():
         tmpl = template.split(':', 1)
         tmpl.extend(content_engine[2:])
-        try:
-            override_mapping = request._override_mapping
-        except AttributeError:
-            override_mapping = request._override_mapping = {}
+        override_mapping = request._override_mapping
+        if override_mapping is None:
+            override_mapping = {}
+            request._fast_setattr('_override_mapping', override_mapping)
         override_mapping.setdefault(default_im_func(view), {}).update({content_type: tmpl})
 
 
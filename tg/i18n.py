@@ -1,8 +1,9 @@
 import copy
-import logging, os
+import logging, os, re
 import gettext as _gettext
 from gettext import NullTranslations, GNUTranslations
 import warnings
+from repoze.lru import LRUCache
 import tg
 from tg.util import lazify
 from tg._compat import PY3, string_type
@@ -15,6 +16,10 @@ class LanguageError(Exception):
     pass
 
 
+# Matches the charset (.UTF-8) and modifier (@euro) parts of a locale identifier
+_LOCALE_CHARSET_MODIFIER_RE = re.compile(r'[.@].*$')
+
+
 def _parse_locale(identifier, sep='_'):
     """
     Took from Babel,
@@ -32,13 +37,9 @@ def _parse_locale(identifier, sep='_'):
 
     :see: `IETF RFC 4646 <http://www.ietf.org/rfc/rfc4646.txt>`_
     """
-    if '.' in identifier:
-        # this is probably the charset/encoding, which we don't care about
-        identifier = identifier.split('.', 1)[0]
-    if '@' in identifier:
-        # this is a locale modifier such as @euro, which we don't care about
-        # either
-        identifier = identifier.split('@', 1)[0]
+    # strip the charset/encoding and locale modifiers such as @euro,
+    # which we don't care about
+    identifier = _LOCALE_CHARSET_MODIFIER_RE.sub('', identifier)
 
     parts = identifier.split(sep)
     lang = parts.pop(0).lower()
@@ -146,6 +147,24 @@ def _translator_from_mofiles(domain, mofiles, class_=None, fallback=False):
     return result
 
 
+_MOFILES_CACHE = LRUCache(1024)
+def _find_mofile(domain, localedir, lang):
+    """Looks up the mo file of a language, caching the result to
+    avoid checking the filesystem on each request.
+
+    Missing translations are not cached, so catalogs compiled while
+    the application is running are picked up by the next request.
+    Returns ``None`` when no translation is available for ``lang``.
+    """
+    key = (domain, localedir, lang)
+    mofile = _MOFILES_CACHE.get(key)
+    if mofile is None:
+        mofile = _gettext.find(domain, localedir=localedir, languages=[lang], all=False)
+        if mofile is not None:
+            _MOFILES_CACHE.put(key, mofile)
+    return mofile
+
+
 def _get_translator(lang, tgl=None, tg_config=None, **kwargs):
     """Utility method to get a valid translator object from a language name"""
     if tg_config:
@@ -173,7 +192,7 @@ def _get_translator(lang, tgl=None, tg_config=None, **kwargs):
     mofiles = []
     supported_languages = []
     for l in lang:
-        mo = _gettext.find(app_domain, localedir=localedir, languages=[l], all=False)
+        mo = _find_mofile(app_domain, localedir, l)
         if mo is not None:
             mofiles.append(mo)
             supported_languages.append(l)
@@ -189,6 +208,32 @@ def _get_translator(lang, tgl=None, tg_config=None, **kwargs):
     return translator
 
 
+def _preload_translators(tg_config):
+    """Loads the translations available in the application localedir,
+    so that requests don't pay the cost of parsing mo files."""
+    try:
+        localedir = tg_config['localedir']
+        app_domain = tg_config['package'].__name__
+    except (KeyError, AttributeError):
+        return
+
+    try:
+        languages = os.listdir(localedir)
+    except OSError:
+        return
+
+    for lang in languages:
+        mofile = _find_mofile(app_domain, localedir, lang)
+        if mofile is None:
+            continue
+
+        try:
+            _translator_from_mofiles(app_domain, [mofile])
+        except Exception as e:
+            # Broken catalogs must only affect requests for their language
+            log.warning('Unable to preload translation %s: %s', mofile, e)
+
+
 def get_lang(all=True):
     """
     Return the current i18n languages used
@@ -220,29 +265,96 @@ def add_fallback(lang, **kwargs):
     return tg.translator.add_fallback(_get_translator(lang, tgl=tgl, **kwargs))
 
 
-sanitized_language_cache = {}
+# Bounded as languages come from the Accept-Language header of each request
+_sanitized_language_cache = LRUCache(512)
+
+
+class _DeprecatedSanitizedLanguageCache(object):
+    """Dictionary like access to the sanitized languages cache.
+
+    Kept for backward compatibility with code that accessed
+    ``sanitized_language_cache`` when it was a plain dict.
+    """
+    _NOT_FOUND = object()
+
+    def _warn(self):
+        warnings.warn("i18n.sanitized_language_cache is deprecated and will be removed.",
+                      DeprecationWarning, stacklevel=3)
+
+    def _lookup(self, lang):
+        return _sanitized_language_cache.get(lang, self._NOT_FOUND)
+
+    def __getitem__(self, lang):
+        self._warn()
+        value = self._lookup(lang)
+        if value is self._NOT_FOUND:
+            raise KeyError(lang)
+        return value
+
+    def __setitem__(self, lang, value):
+        self._warn()
+        _sanitized_language_cache.put(lang, value)
+
+    def __delitem__(self, lang):
+        self._warn()
+        if self._lookup(lang) is self._NOT_FOUND:
+            raise KeyError(lang)
+        _sanitized_language_cache.invalidate(lang)
+
+    def __contains__(self, lang):
+        self._warn()
+        return self._lookup(lang) is not self._NOT_FOUND
+
+    def get(self, lang, default=None):
+        self._warn()
+        value = self._lookup(lang)
+        if value is self._NOT_FOUND:
+            return default
+        return value
+
+    def pop(self, lang, *default):
+        self._warn()
+        value = self._lookup(lang)
+        if value is self._NOT_FOUND:
+            if default:
+                return default[0]
+            raise KeyError(lang)
+        _sanitized_language_cache.invalidate(lang)
+        return value
+
+    def clear(self):
+        self._warn()
+        _sanitized_language_cache.clear()
+
+sanitized_language_cache = _DeprecatedSanitizedLanguageCache()
+
 def sanitize_language_code(lang):
     """Sanitize the language code if the spelling is slightly wrong.
 
     For instance, 'pt-br' and 'pt_br' should be interpreted as 'pt_BR'.
 
     """
-    try:
-        lang = sanitized_language_cache[lang]
-    except:
-        orig_lang = lang
+    sanitized_lang = _sanitized_language_cache.get(lang)
+    if sanitized_lang is not None:
+        return sanitized_lang
+
+    orig_lang = lang
+    if '-' not in lang:
+        separators = ('_',)
+    elif '_' not in lang:
+        # Accept-Language style tag (pt-BR), parsing on '_' would always fail
+        separators = ('-',)
+    else:
+        separators = ('_', '-')
 
+    for sep in separators:
         try:
-            lang = '_'.join(filter(None, _parse_locale(lang)[:2]))
+            lang = '_'.join(filter(None, _parse_locale(orig_lang, sep=sep)[:2]))
+            break
         except ValueError:
-            if '-' in lang:
-                try:
-                    lang = '_'.join(filter(None, _parse_locale(lang, sep='-')[:2]))
-                except ValueError:
-                    pass
-
-        sanitized_language_cache[orig_lang] = lang
+            pass
 
+    _sanitized_language_cache.put(orig_lang, lang)
     return lang
 
 
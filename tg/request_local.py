@@ -65,7 +65,8 @@ class Request(WebObRequest):
     def controller_url(self):
         """Url of the current controller."""
         state = self._controller_state
-        return '/'.join(state.path[:-len(state.remainder)])
+        path = state.path
+        return '/'.join(path[:len(path) - len(state.remainder)])
 
     @cached_property
     def plain_languages(self):
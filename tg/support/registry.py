@@ -162,6 +162,8 @@ class Registry(object):
     tracked.
 
     """
+    __slots__ = ('reglist', 'enable_preservation')
+
     def __init__(self, enable_preservation=False):
         """Create a new Registry object
 
@@ -6,6 +6,8 @@ class LazyString(object):
     to create the actual string. This is used mostly by lazy internationalization.
 
     """
+    __slots__ = ('func', 'args', 'kwargs')
+
     def __init__(self, func, *args, **kwargs):
         self.func = func
         self.args = args
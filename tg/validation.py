@@ -93,9 +93,9 @@ class _ValidationIntent(object):
                     errors[field] = inv
 
             # Parameters that don't have validators are returned verbatim
-            for param, param_value in params.items():
-                if param not in validated_params:
-                    validated_params[param] = param_value
+            all_params = dict(params)
+            all_params.update(validated_params)
+            validated_params = all_params
 
             # If there are errors, create a compound validation error based on
             # the errors dictionary, and raise it as an exception
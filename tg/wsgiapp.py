@@ -150,6 +150,8 @@ class TGApp(object):
         req = Request(environ)
         req._fast_setattr('_language', self.lang)
         req._fast_setattr('_response_type', None)
+        req._fast_setattr('_render_custom_format', None)
+        req._fast_setattr('_override_mapping', None)
 
         resp_options = self.resp_options
         response = Response(